@@ -0,0 +1,325 @@
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+
+
+class HistoryStore:
+    """Append-only store of per-run changes to rankings, prices and scores
+
+    The store consists of two append-only files:
+      - strings.jsonl: dictionary of every string used (keys, fields, values),
+        the line number is the string id
+      - deltas.jsonl: one line per run with parallel 'keys', 'fields' and
+        'values' columns holding only the values that changed in that run.
+        A null value means the game or one of its values disappeared.
+    """
+
+    # Fields whose values are dictionary encoded
+    STRING_FIELDS = {'title', 'price', 'steamdeck'}
+
+    def __init__(self, history_dir: Path = Path('history')):
+        self.history_dir = history_dir
+        self.strings_file = self.history_dir / 'strings.jsonl'
+        self.deltas_file = self.history_dir / 'deltas.jsonl'
+
+        self.strings: List[str] = []
+        self.string_ids: Dict[str, int] = {}
+        # Date of each run, in order
+        self.runs: List[str] = []
+        # key id -> [(run index, field id, value)], in run order
+        self.events: Dict[int, List[Tuple[int, int, Any]]] = {}
+        # key id -> field id -> latest value
+        self.state: Dict[int, Dict[int, Any]] = {}
+
+        self._load()
+
+    @staticmethod
+    def _read_records(path: Path) -> List[Any]:
+        """Read a JSON lines file, dropping a torn last line left by an interrupted append"""
+        if not path.exists():
+            return []
+
+        with open(path, 'rb') as f:
+            lines = f.readlines()
+
+        records = []
+        valid_size = 0
+        for i, line in enumerate(lines):
+            try:
+                if not line.endswith(b'\n'):
+                    raise ValueError("missing line end")
+                records.append(json.loads(line))
+            except ValueError as e:
+                if i < len(lines) - 1:
+                    raise
+                # Cut the torn line so the next append starts on a clean line
+                print(f"Dropping torn last line of {path}: {e}")
+                with open(path, 'r+b') as f:
+                    f.truncate(valid_size)
+                break
+            valid_size += len(line)
+        return records
+
+    def _load(self):
+        """Load the dictionary and replay all deltas"""
+        for value in self._read_records(self.strings_file):
+            self.string_ids[value] = len(self.strings)
+            self.strings.append(value)
+
+        for delta in self._read_records(self.deltas_file):
+            self._apply_delta(delta)
+
+    def _apply_delta(self, delta: Dict[str, Any]):
+        """Apply a single run delta to the in-memory index"""
+        run_index = len(self.runs)
+        self.runs.append(delta['date'])
+        for key_id, field_id, value in zip(delta['keys'], delta['fields'], delta['values']):
+            self.events.setdefault(key_id, []).append((run_index, field_id, value))
+            self.state.setdefault(key_id, {})[field_id] = value
+
+    def _string_id(self, value: str, new_strings: List[str]) -> int:
+        """Get the dictionary id of a string, registering it if it is new"""
+        if value not in self.string_ids:
+            self.string_ids[value] = len(self.strings)
+            self.strings.append(value)
+            new_strings.append(value)
+        return self.string_ids[value]
+
+    def _decode(self, field: str, value: Any) -> Any:
+        """Turn a stored value back into its original form"""
+        if value is not None and field in self.STRING_FIELDS:
+            return self.strings[value]
+        return value
+
+    @staticmethod
+    def game_key(game: Dict[str, Any]) -> str:
+        """Get the stable key of a game, preferring its Steam app id"""
+        if game.get('steam_id'):
+            return f"steam:{game['steam_id']}"
+        return f"title:{game['title'].lower()}"
+
+    def _resolve_key(self, game: Dict[str, Any]) -> str:
+        """Get the key a game is stored under
+
+        A game that only gets a Steam match after earlier runs keeps its
+        title key, so its history continues instead of restarting.
+        """
+        key = self.game_key(game)
+        if key.startswith('steam:') and key not in self.string_ids:
+            title_key = f"title:{game['title'].lower()}"
+            if self.string_ids.get(title_key) in self.state:
+                return title_key
+        return key
+
+    @staticmethod
+    def game_fields(game: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten the tracked values of a merged game"""
+        fields = {
+            'title': game.get('title'),
+            'price': game.get('price'),
+            'user_score': round(game['user_score'], 4) if game.get('user_score') is not None else None,
+            'total_reviews': game.get('total_reviews'),
+            'steamdeck': game.get('platforms', {}).get('steamdeck'),
+            'metacritic': game.get('metacritic'),
+        }
+        for source, rank in game.get('rankings', {}).items():
+            fields[f"rank:{source}"] = rank
+        return fields
+
+    def append_run(self, games: List[Dict[str, Any]], run_date: Optional[str] = None,
+                   failed_sources: Optional[List[str]] = None) -> int:
+        """Append the changes of a run to the store and return its index
+
+        Rankings of failed sources keep their previous values instead of
+        being recorded as removed.
+        """
+        run_date = run_date or datetime.now(timezone.utc).isoformat(timespec='seconds')
+        new_strings: List[str] = []
+        keys: List[int] = []
+        fields: List[int] = []
+        values: List[Any] = []
+
+        failed_fields = {
+            self.string_ids[f"rank:{source}"] for source in failed_sources or []
+            if f"rank:{source}" in self.string_ids
+        }
+
+        # Games sharing a key (e.g. two titles matched to one Steam app) are
+        # folded into one record: first title, union of their rankings
+        folded: Dict[str, Dict[str, Any]] = {}
+        for game in games:
+            game_fields = self.game_fields(game)
+            key = self._resolve_key(game)
+            if key not in folded:
+                folded[key] = game_fields
+                continue
+            for field, value in game_fields.items():
+                if field.startswith('rank:'):
+                    folded[key].setdefault(field, value)
+
+        seen = set()
+        for key, game_fields in folded.items():
+            key_id = self._string_id(key, new_strings)
+            seen.add(key_id)
+            previous = self.state.get(key_id, {})
+
+            current = {}
+            for field, value in game_fields.items():
+                field_id = self._string_id(field, new_strings)
+                if value is not None and field in self.STRING_FIELDS:
+                    value = self._string_id(value, new_strings)
+                current[field_id] = value
+
+            # Rankings the game no longer has are recorded as removed
+            for field_id in previous:
+                if field_id not in failed_fields:
+                    current.setdefault(field_id, None)
+
+            for field_id, value in current.items():
+                if previous.get(field_id) != value:
+                    keys.append(key_id)
+                    fields.append(field_id)
+                    values.append(value)
+
+        # Games that dropped out of every list keep their last title
+        title_field = self._string_id('title', new_strings)
+        for key_id, previous in self.state.items():
+            if key_id in seen:
+                continue
+            # The game may only be missing because its list could not be fetched
+            if any(previous.get(field_id) is not None for field_id in failed_fields):
+                continue
+            for field_id, value in previous.items():
+                if value is not None and field_id != title_field:
+                    keys.append(key_id)
+                    fields.append(field_id)
+                    values.append(None)
+
+        delta = {'date': run_date, 'keys': keys, 'fields': fields, 'values': values}
+
+        # Strings are written first so a delta never references a missing id
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        if new_strings:
+            with open(self.strings_file, 'a', encoding='utf-8') as f:
+                for value in new_strings:
+                    f.write(json.dumps(value, ensure_ascii=False) + '\n')
+        with open(self.deltas_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(delta, separators=(',', ':')) + '\n')
+
+        self._apply_delta(delta)
+        print(f"Recorded {len(keys)} changes in history run {len(self.runs) - 1}")
+        return len(self.runs) - 1
+
+    def find_key(self, game: str) -> Optional[int]:
+        """Find the key id of a game by store key, Steam app id or title"""
+        for candidate in (game, f"steam:{game}", f"title:{game.lower()}"):
+            if candidate in self.string_ids and self.string_ids[candidate] in self.events:
+                return self.string_ids[candidate]
+
+        # Fall back to the latest recorded title
+        title_field = self.string_ids.get('title')
+        for key_id, state in self.state.items():
+            title_id = state.get(title_field)
+            if title_id is not None and self.strings[title_id].lower() == game.lower():
+                return key_id
+        return None
+
+    def game_history(self, game: str) -> Dict[str, List[Tuple[str, Any]]]:
+        """Get the (date, value) changes of every tracked field of a game"""
+        key_id = self.find_key(game)
+        if key_id is None:
+            return {}
+
+        history: Dict[str, List[Tuple[str, Any]]] = {}
+        for run_index, field_id, value in self.events[key_id]:
+            field = self.strings[field_id]
+            history.setdefault(field, []).append((self.runs[run_index], self._decode(field, value)))
+        return history
+
+    def _state_at(self, key_id: int, run_index: int) -> Dict[int, Any]:
+        """Get the field values of a game as of a given run"""
+        state: Dict[int, Any] = {}
+        for event_run, field_id, value in self.events.get(key_id, []):
+            if event_run > run_index:
+                break
+            state[field_id] = value
+        return state
+
+    def biggest_movers(self, since: str, field_prefix: str = 'rank:', limit: int = 20) -> List[Dict[str, Any]]:
+        """Get the games whose numeric fields changed the most since a date
+
+        For rankings a positive change means the game moved up the list.
+        Dictionary encoded fields such as price are never ranked.
+        """
+        if field_prefix in self.STRING_FIELDS:
+            raise ValueError(f"Field '{field_prefix}' is not numeric")
+        if not self.runs:
+            return []
+
+        # Compare against the last run before the date, or the first run
+        baseline = 0
+        for run_index, run_date in enumerate(self.runs):
+            if run_date >= since:
+                break
+            baseline = run_index
+
+        title_field = self.string_ids.get('title')
+        movers = []
+        for key_id, current in self.state.items():
+            before = self._state_at(key_id, baseline)
+            for field_id, value in current.items():
+                field = self.strings[field_id]
+                old_value = before.get(field_id)
+                if not field.startswith(field_prefix) or field in self.STRING_FIELDS:
+                    continue
+                if value is None or old_value is None:
+                    continue
+                change = old_value - value if field.startswith('rank:') else value - old_value
+                if change == 0:
+                    continue
+                movers.append({
+                    'key': self.strings[key_id],
+                    'title': self._decode('title', current.get(title_field)),
+                    'field': field,
+                    'from': old_value,
+                    'to': value,
+                    'change': change
+                })
+
+        movers.sort(key=lambda mover: abs(mover['change']), reverse=True)
+        return movers[:limit]
+
+    def export_game_files(self, output_dir: Path):
+        """Write a compact history file per game plus an index for the frontend"""
+        output_dir.mkdir(parents=True, exist_ok=True)
+        title_field = self.string_ids.get('title')
+        index = {}
+
+        for key_id in self.events:
+            key = self.strings[key_id]
+            # The string id keeps keys that slugify alike apart
+            slug = re.sub(r'[^a-z0-9]+', '_', key.lower()).strip('_')
+            file_name = f"{slug}_{key_id}.json"
+            history = {
+                field: [[date, value] for date, value in changes]
+                for field, changes in self.game_history(key).items()
+            }
+            with open(output_dir / file_name, 'w', encoding='utf-8') as f:
+                json.dump(history, f, separators=(',', ':'), ensure_ascii=False)
+
+            title_id = self.state[key_id].get(title_field)
+            index[key] = {
+                'title': self.strings[title_id] if title_id is not None else None,
+                'file': file_name
+            }
+
+        with open(output_dir / 'index.json', 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, ensure_ascii=False)
+
+        # Remove files of an older naming scheme or of games no longer stored
+        exported = {entry['file'] for entry in index.values()} | {'index.json'}
+        for history_file in output_dir.glob('*.json'):
+            if history_file.name not in exported:
+                history_file.unlink()
@@ -0,0 +1,171 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Any, Set, Tuple
+import requests
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+
+class ImageMirror:
+    """Mirror header images locally and replace them with small thumbnails"""
+
+    def __init__(self, headers: Dict[str, str], cache_dir: Path, output_dir: Path,
+                 public_prefix: str = 'images/thumbs', max_workers: int = 8):
+        self.headers = headers
+        self.cache_dir = cache_dir
+        self.output_dir = output_dir
+        self.public_prefix = public_prefix
+        self.max_workers = max_workers
+        # Cards are 150px high, keep enough pixels for high density screens
+        self.thumbnail_size: Tuple[int, int] = (640, 300)
+        self.index_file = self.cache_dir / 'index.json'
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the url -> cached image metadata index"""
+        if self.index_file.exists():
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def _save_index(self, index: Dict[str, Dict[str, Any]]):
+        """Save the url -> cached image metadata index"""
+        with open(self.index_file, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2)
+
+    def _thumbnail_name(self, digest: str) -> str:
+        """Get the thumbnail file name for an image content hash"""
+        extension = 'webp' if features.check('webp') else 'jpg'
+        return f"{digest[:16]}.{extension}"
+
+    def _write_atomic(self, target: Path, write: Callable[[Path], None]):
+        """Write a file under a temporary name and move it into place"""
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix='.tmp')
+        os.close(fd)
+        try:
+            write(Path(tmp_name))
+            os.replace(tmp_name, target)
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _make_thumbnail(self, digest: str) -> Optional[str]:
+        """Create the thumbnail for a cached image unless it already exists"""
+        try:
+            thumbnail_file = self.output_dir / self._thumbnail_name(digest)
+            if not thumbnail_file.exists():
+                with Image.open(self.cache_dir / digest) as img:
+                    img = img.convert('RGB')
+                    img.thumbnail(self.thumbnail_size, Image.LANCZOS)
+                    if thumbnail_file.suffix == '.webp':
+                        self._write_atomic(thumbnail_file, lambda path: img.save(
+                            path, 'WEBP', quality=80, method=6))
+                    else:
+                        self._write_atomic(thumbnail_file, lambda path: img.save(
+                            path, 'JPEG', quality=80, optimize=True, progressive=True))
+            return f"{self.public_prefix}/{thumbnail_file.name}"
+
+        except Exception as e:
+            print(f"Error creating thumbnail for {digest}: {e}")
+            return None
+
+    def _mirror_url(self, url: str, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Download a single image into the content-addressed cache"""
+        try:
+            headers = dict(self.headers)
+            digest = entry.get('sha256')
+
+            # Only ask for a 304 if we still have what it would point to
+            if digest and (self.cache_dir / digest).exists():
+                if entry.get('etag'):
+                    headers['If-None-Match'] = entry['etag']
+                if entry.get('last_modified'):
+                    headers['If-Modified-Since'] = entry['last_modified']
+
+            response = requests.get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                print(f"Image unchanged: {url}")
+                return entry
+
+            response.raise_for_status()
+            digest = hashlib.sha256(response.content).hexdigest()
+            original_file = self.cache_dir / digest
+            # Different URLs can serve the same bytes, so never expose a partial file
+            if not original_file.exists():
+                self._write_atomic(original_file, lambda path: path.write_bytes(response.content))
+            return {
+                'sha256': digest,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }
+
+        except Exception as e:
+            print(f"Error mirroring image {url}: {e}")
+            return None
+
+    def _remove_unused(self, index: Dict[str, Dict[str, Any]], used: Set[str]):
+        """Drop index entries, thumbnails and originals no game points to anymore"""
+        for url in [url for url, entry in index.items() if entry.get('thumbnail') not in used]:
+            del index[url]
+
+        for thumbnail_file in self.output_dir.iterdir():
+            if f"{self.public_prefix}/{thumbnail_file.name}" not in used:
+                print(f"Removing unused thumbnail: {thumbnail_file.name}")
+                thumbnail_file.unlink()
+
+        # Originals are named by their content hash, everything else is kept
+        digests = {entry['sha256'] for entry in index.values()}
+        for original_file in self.cache_dir.iterdir():
+            if re.fullmatch(r'[0-9a-f]{64}', original_file.name) and original_file.name not in digests:
+                print(f"Removing unused original image: {original_file.name}")
+                original_file.unlink()
+
+    def mirror(self, games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Rewrite header_image of every game to a local thumbnail"""
+        if Image is None:
+            print("Pillow is not installed, skipping image mirroring")
+            return games
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        index = self._load_index()
+
+        urls = list(dict.fromkeys(
+            game['header_image'] for game in games
+            if game.get('header_image', '').startswith('http')
+        ))
+        print(f"Mirroring {len(urls)} header images...")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(lambda url: self._mirror_url(url, dict(index.get(url, {}))), urls)
+            downloaded = dict(zip(urls, results))
+
+        # Thumbnails are built once per image content, after all downloads finished
+        digests = {entry['sha256'] for entry in downloaded.values() if entry}
+        thumbnails = dict(zip(digests, map(self._make_thumbnail, digests)))
+        for url, entry in downloaded.items():
+            if entry and thumbnails.get(entry['sha256']):
+                entry['thumbnail'] = thumbnails[entry['sha256']]
+                index[url] = entry
+
+        # Games whose image failed keep hotlinking the original URL
+        for game in games:
+            entry = index.get(game.get('header_image', ''))
+            if entry and entry.get('thumbnail'):
+                game['header_image'] = entry['thumbnail']
+
+        used = {
+            game['header_image'] for game in games
+            if game.get('header_image', '').startswith(f"{self.public_prefix}/")
+        }
+        self._remove_unused(index, used)
+        self._save_index(index)
+
+        return games
@@ -4,19 +4,23 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from difflib import SequenceMatcher
+from itertools import combinations
 import requests
 
 from .config import config
+from .history import HistoryStore
+from .images import ImageMirror
 from .special_cases import load_special_cases
 from .utils import (
     clean_title_for_matching,
     is_roman_numeral,
     numeral_to_number,
+    title_blocking_keys,
 )
 from .scrapers import get_all_scrapers
 
 class GameScraper:
-    def __init__(self):
+    def __init__(self, mirror_images: bool = False, force_refresh: bool = False):
         # Initialize config handler
         config.setup_config()
         self.rawg_api_key = config.get_api_key('RAWG')
@@ -31,6 +35,9 @@ class GameScraper:
         self.data_dir.mkdir(exist_ok=True)
         self.cache_dir.mkdir(exist_ok=True)
         self.FUZZY_MATCH_THRESHOLD: float = 0.90
+        # Blocks larger than this are compared with a sliding window only
+        self.MAX_BLOCK_SIZE: int = 50
+        self.BLOCK_WINDOW: int = 10
 
         # Load special cases
         self.special_cases: Dict[str, str] = load_special_cases()
@@ -41,6 +48,19 @@ class GameScraper:
         # Collect all games which couldn't be found
         self.unmatched_games: List[str] = []
 
+        # Optionally replace hotlinked header images with local thumbnails
+        self.mirror_images: bool = mirror_images
+
+        # Rebuild merged data even if no source page changed
+        self.force_refresh: bool = force_refresh
+
+        # Outcome of the last scrape per source: 'changed', 'unchanged' or 'failed'
+        self.source_status: Dict[str, str] = {}
+
+        # Rankings, prices and scores of every run, loaded when the run is saved
+        self.history_dir: Path = Path('history')
+        self.history: Optional[HistoryStore] = None
+
         # Load all scrapers - they're already instantiated
         self.scrapers: List[BaseScraper] = get_all_scrapers()
 
@@ -314,11 +334,68 @@ class GameScraper:
             print(f"Error getting Steam info for {game_title}: {e}")
             return None
 
+    def cluster_games(self, all_games: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Map each normalized title key to the title of its duplicate cluster"""
+        # Entries with identical normalized titles always belong together
+        titles: Dict[str, str] = {}
+        key_sources: Dict[str, set] = {}
+        for game in all_games:
+            normalized_title = self.normalize_title(game['title'])
+            title_key = normalized_title.lower()
+            titles.setdefault(title_key, normalized_title)
+            key_sources.setdefault(title_key, set()).add(game['source'])
+
+        keys = list(titles)
+        parent = list(range(len(keys)))
+        sources = [key_sources[key] for key in keys]
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        # Only titles sharing a blocking key are compared with each other
+        blocks: Dict[Any, List[int]] = {}
+        for i, key in enumerate(keys):
+            for block_key in title_blocking_keys(key):
+                blocks.setdefault(block_key, []).append(i)
+
+        for members in blocks.values():
+            if len(members) > self.MAX_BLOCK_SIZE:
+                members = sorted(members, key=lambda i: keys[i])
+                pairs = [
+                    (members[a], members[b])
+                    for a in range(len(members))
+                    for b in range(a + 1, min(a + 1 + self.BLOCK_WINDOW, len(members)))
+                ]
+            else:
+                pairs = combinations(members, 2)
+
+            for i, j in pairs:
+                root_i, root_j = find(i), find(j)
+                if root_i == root_j:
+                    continue
+                # A single list never ranks the same game twice
+                if sources[root_i] & sources[root_j]:
+                    continue
+                if self.title_similarity(keys[i], keys[j]) < self.FUZZY_MATCH_THRESHOLD:
+                    continue
+                print(f"Merging duplicate titles: {keys[i]} / {keys[j]}")
+                # Keep the first seen title as the root of the cluster
+                root, other = min(root_i, root_j), max(root_i, root_j)
+                parent[other] = root
+                sources[root] |= sources[other]
+
+        return {key: titles[keys[find(i)]] for i, key in enumerate(keys)}
+
     def merge_and_deduplicate(self, all_games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         unique_games: Dict[str, Dict[str, Any]] = {}
+        cluster_titles = self.cluster_games(all_games)
 
         for game in all_games:
-            normalized_title = self.normalize_title(game['title'])
+            # Near-identical titles share one record and one enrichment lookup
+            normalized_title = cluster_titles[self.normalize_title(game['title']).lower()]
             title_key = normalized_title.lower()
 
             if title_key not in unique_games:
@@ -389,18 +466,54 @@ class GameScraper:
             print(f"Scraping {scraper.name}...")
             games = scraper.scrape(self.headers)
             all_games.extend(games)
+            self.source_status[scraper.name] = scraper.status
             time.sleep(2)  # Politeness delay
 
-        # Merge and deduplicate games
-        merged_games = self.merge_and_deduplicate(all_games)
+        print(f"Source status: {self.source_status}")
+        raw_file = self.data_dir / 'raw_games.json'
+        merged_file = self.data_dir / 'merged_games.json'
+        unchanged = bool(self.source_status) and all(
+            status == 'unchanged' for status in self.source_status.values()
+        ) and raw_file.exists() and merged_file.exists()
+
+        # A source that failed last run is 'unchanged' against its page cache but
+        # missing from the previous output, so also require the same raw entries
+        if unchanged:
+            with open(raw_file, 'r', encoding='utf-8') as f:
+                unchanged = json.load(f) == all_games
+
+        # Enrichment is cached on disk, so unchanged lists merge to the same result
+        if unchanged and not self.force_refresh:
+            print("No source changed since the last run, reusing merged games")
+            with open(merged_file, 'r', encoding='utf-8') as f:
+                merged_games = json.load(f)
+        else:
+            # Merge and deduplicate games
+            merged_games = self.merge_and_deduplicate(all_games)
+
+        if self.mirror_images:
+            image_mirror = ImageMirror(
+                self.headers,
+                self.cache_dir / 'images',
+                self.data_dir.parent / 'images' / 'thumbs'
+            )
+            merged_games = image_mirror.mirror(merged_games)
 
         # Save raw data and merged data
         self.data_dir.mkdir(exist_ok=True)
-        with open(self.data_dir / 'raw_games.json', 'w', encoding='utf-8') as f:
+        with open(raw_file, 'w', encoding='utf-8') as f:
             json.dump(all_games, f, indent=2, ensure_ascii=False)
-        with open(self.data_dir / 'merged_games.json', 'w', encoding='utf-8') as f:
+        with open(merged_file, 'w', encoding='utf-8') as f:
             json.dump(merged_games, f, indent=2, ensure_ascii=False)
 
+        # Record what changed since the previous run
+        failed_sources = [name for name, status in self.source_status.items() if status == 'failed']
+        if failed_sources:
+            print(f"Keeping previous rankings in history for failed sources: {failed_sources}")
+        self.history = HistoryStore(self.history_dir)
+        self.history.append_run(merged_games, failed_sources=failed_sources)
+        self.history.export_game_files(self.data_dir / 'history')
+
         # Write unmatched games to a file
         if self.unmatched_games:
             unmatched_file = self.data_dir / 'unmatched_games.txt'
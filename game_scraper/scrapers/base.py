@@ -3,6 +3,8 @@ from typing import Dict, Any, List
 
 class BaseScraper(ABC):
     name: str
+    # Outcome of the last scrape: 'changed', 'unchanged' or 'failed'
+    status: str = 'failed'
 
     @abstractmethod
     def scrape(self, headers: Dict[str, str]) -> List[Dict[str, Any]]:
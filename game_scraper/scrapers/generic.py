@@ -1,4 +1,7 @@
 from typing import Dict, Any, List, Optional
+import hashlib
+import json
+import os
 import requests
 from bs4 import BeautifulSoup, Tag
 import re
@@ -8,10 +11,13 @@ from .base import BaseScraper
 from ..config import config
 
 class GenericScraper(BaseScraper):
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], cache_dir: Path = Path('cache') / 'pages'):
         self.name = config['name']
         self.url = config['url']
         self.parser_config = config['parser_config']
+        self.status = 'failed'
+        self.cache_dir = cache_dir
+        self.state_file = self.cache_dir / f"{self.name.lower()}.json"
 
     def find_element(self, soup: BeautifulSoup, config: Dict[str, Any]) -> List[Tag]:
         """Find elements based on configuration"""
@@ -54,49 +60,112 @@ class GenericScraper(BaseScraper):
             print(f"Error extracting title and rank: {e}")
             return None
 
+    def _load_state(self) -> Dict[str, Any]:
+        """Load validators and entries from the previous fetch of this page"""
+        if self.state_file.exists():
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            except json.JSONDecodeError as e:
+                print(f"Ignoring unreadable page cache for {self.name}: {e}")
+                return {}
+            # Entries are only reusable if they were extracted the same way
+            if state.get('url') == self.url and state.get('parser_config') == self.parser_config:
+                return state
+        return {}
+
+    def _save_state(self, state: Dict[str, Any]):
+        """Save validators and entries of the latest fetch of this page"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write next to the target and swap, so an interrupted write never truncates it
+        tmp_file = self.state_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, self.state_file)
+
+    def parse(self, html: str) -> List[Dict[str, Any]]:
+        """Extract ranked games from the page based on configuration"""
+        soup = BeautifulSoup(html, 'html.parser')
+        games = []
+
+        # Find all container elements
+        containers = self.find_element(soup, self.parser_config['container'])
+
+        for container in containers:
+            # Extract title and rank based on configuration
+            if self.parser_config.get('rank_from_container', False):
+                rank = int(container.text.strip())
+                title_config = self.parser_config['title']
+                title_element = container.find_next(
+                    title_config['tag'],
+                    **(title_config.get('attributes', {}))
+                )
+                if title_element:
+                    title = title_element.text.strip()
+                    result = (title, rank)
+                else:
+                    continue
+            else:
+                result = self.extract_title_and_rank(
+                    container,
+                    self.parser_config['title']
+                )
+
+            if result:
+                title, rank = result
+                games.append({
+                    'rank': rank,
+                    'title': title,
+                    'source': self.name
+                })
+
+        return games
+
     def scrape(self, headers: Dict[str, str]) -> List[Dict[str, Any]]:
-        """Scrape website based on configuration"""
+        """Scrape website based on configuration, reusing unchanged pages"""
         try:
-            response = requests.get(self.url, headers=headers)
+            state = self._load_state()
+            request_headers = dict(headers)
+            if 'games' in state:
+                if state.get('etag'):
+                    request_headers['If-None-Match'] = state['etag']
+                if state.get('last_modified'):
+                    request_headers['If-Modified-Since'] = state['last_modified']
+
+            response = requests.get(self.url, headers=request_headers)
+            if response.status_code == 304:
+                print(f"{self.name} not modified, reusing previous entries")
+                self.status = 'unchanged'
+                return state['games']
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            games = []
-
-            # Find all container elements
-            containers = self.find_element(soup, self.parser_config['container'])
-
-            for container in containers:
-                # Extract title and rank based on configuration
-                if self.parser_config.get('rank_from_container', False):
-                    rank = int(container.text.strip())
-                    title_config = self.parser_config['title']
-                    title_element = container.find_next(
-                        title_config['tag'],
-                        **(title_config.get('attributes', {}))
-                    )
-                    if title_element:
-                        title = title_element.text.strip()
-                        result = (title, rank)
-                    else:
-                        continue
-                else:
-                    result = self.extract_title_and_rank(
-                        container,
-                        self.parser_config['title']
-                    )
 
-                if result:
-                    title, rank = result
-                    games.append({
-                        'rank': rank,
-                        'title': title,
-                        'source': self.name
-                    })
+            # Identical bytes are a shortcut to skip parsing, but pages embed ads
+            # and nonces, so the extracted entries decide whether anything moved
+            content_hash = hashlib.sha256(response.content).hexdigest()
+            if 'games' in state and state.get('sha256') == content_hash:
+                print(f"{self.name} content unchanged, reusing previous entries")
+                games = state['games']
+            else:
+                games = self.parse(response.text)
 
+            if 'games' in state and games == state['games']:
+                self.status = 'unchanged'
+            else:
+                self.status = 'changed'
+
+            self._save_state({
+                'url': self.url,
+                'parser_config': self.parser_config,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'sha256': content_hash,
+                'games': games
+            })
             return games
 
         except Exception as e:
             print(f"Error scraping {self.name}: {e}")
+            self.status = 'failed'
             return []
 
 class ScraperFactory:
@@ -1,5 +1,5 @@
 import re
-from typing import Optional
+from typing import Optional, Set, Tuple
 
 
 def clean_title_for_matching(title: str) -> str:
@@ -33,3 +33,24 @@ def numeral_to_number(numeral: str) -> Optional[int]:
         return roman_to_int[numeral.upper()]
     else:
         return None
+
+
+def title_blocking_keys(title: str, prefix_length: int = 4) -> Set[Tuple[str, Tuple[int, ...]]]:
+    """Get blocking keys used to find candidate duplicate titles"""
+    words = clean_title_for_matching(title).split()
+    if not words:
+        return set()
+
+    # Titles with different numerals never match, so they never share a block
+    numerals = tuple(
+        numeral_to_number(w) for w in words
+        if (w.isascii() and w.isdigit()) or is_roman_numeral(w)
+    )
+
+    # Prefix of the first word and of the title without spaces, so that
+    # "Half-Life Alyx" and "Half Life Alyx" end up in the same block
+    joined = ''.join(words)
+    return {
+        (f"word:{words[0][:prefix_length]}", numerals),
+        (f"joined:{joined[:prefix_length + 2]}", numerals),
+    }
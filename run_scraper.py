@@ -1,8 +1,23 @@
+import argparse
+
 from game_scraper.scraper import GameScraper
 from game_scraper.config import config
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Scrape and merge top games lists")
+    parser.add_argument(
+        '--mirror-images',
+        action='store_true',
+        help="Download header images and serve local thumbnails (requires Pillow)"
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help="Rebuild merged data even if no source page changed"
+    )
+    args = parser.parse_args()
+
     # Initialize configuration first
     config.setup_config()
 
@@ -13,7 +28,7 @@ def main():
         return
 
     # Create and run scraper
-    scraper = GameScraper()
+    scraper = GameScraper(mirror_images=args.mirror_images, force_refresh=args.force)
     games = scraper.run()
     print(f"\nScraped {len(games)} games successfully!")
 
@@ -0,0 +1,64 @@
+import unittest
+from game_scraper.scraper import GameScraper
+from game_scraper.utils import title_blocking_keys
+
+
+def make_scraper():
+    # Skip __init__, which needs API keys and the Steam games list
+    scraper = GameScraper.__new__(GameScraper)
+    scraper.special_cases = {}
+    scraper.FUZZY_MATCH_THRESHOLD = 0.90
+    scraper.MAX_BLOCK_SIZE = 50
+    scraper.BLOCK_WINDOW = 10
+    return scraper
+
+
+class TestTitleBlockingKeys(unittest.TestCase):
+    def test_spelling_variants_share_a_block(self):
+        keys1 = title_blocking_keys('Half-Life Alyx')
+        keys2 = title_blocking_keys('Half Life Alyx')
+        self.assertTrue(keys1 & keys2)
+
+    def test_numerals_separate_blocks(self):
+        self.assertFalse(title_blocking_keys('Dark Souls') & title_blocking_keys('Dark Souls II'))
+        self.assertFalse(title_blocking_keys('Dark Souls 2') & title_blocking_keys('Dark Souls III'))
+
+
+class TestClusterGames(unittest.TestCase):
+    def setUp(self):
+        self.scraper = make_scraper()
+
+    def cluster(self, *entries):
+        games = [{'title': title, 'source': source, 'rank': i + 1} for i, (title, source) in enumerate(entries)]
+        return self.scraper.cluster_games(games)
+
+    def test_merges_punctuation_variants(self):
+        clusters = self.cluster(('Half-Life: Alyx', 'IGN'), ('Half Life Alyx', 'PCGamer'))
+        self.assertEqual(set(clusters.values()), {'Half-Life Alyx'})
+
+    def test_merges_numeral_variants(self):
+        clusters = self.cluster(('Resident Evil 4 (Remake)', 'IGN'), ('Resident Evil IV (Remake)', 'RockPaperShotgun'))
+        self.assertEqual(len(set(clusters.values())), 1)
+
+    def test_same_source_never_merges(self):
+        clusters = self.cluster(('Half-Life: Alyx', 'IGN'), ('Half Life Alyx', 'IGN'))
+        self.assertEqual(len(set(clusters.values())), 2)
+
+    def test_different_games_stay_separate(self):
+        clusters = self.cluster(('Star Wars KOTOR', 'IGN'), ('KOTOR II', 'PCGamer'))
+        self.assertEqual(len(set(clusters.values())), 2)
+
+    def test_merge_and_deduplicate_enriches_once(self):
+        looked_up = []
+        self.scraper.get_steam_info = lambda title: looked_up.append(title)
+        self.scraper.get_rawg_info = lambda title: None
+        games = self.scraper.merge_and_deduplicate([
+            {'title': 'Half-Life: Alyx', 'source': 'IGN', 'rank': 3},
+            {'title': 'Half Life Alyx', 'source': 'PCGamer', 'rank': 7},
+        ])
+        self.assertEqual(looked_up, ['Half-Life Alyx'])
+        self.assertEqual(games[0]['rankings'], {'IGN': 3, 'PCGamer': 7})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from game_scraper.scrapers.generic import GenericScraper
+
+GAMES = [{'rank': 1, 'title': 'Half-Life Alyx', 'source': 'IGN'}]
+
+
+def make_response(status_code=200, body='<html></html>', headers=None):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.text = body
+    response.content = body.encode()
+    response.headers = headers or {}
+    return response
+
+
+class TestGenericScraperConditionalFetch(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        config = {'name': 'IGN', 'url': 'https://example.com/top-100', 'parser_config': {}}
+        self.scraper = GenericScraper(config, cache_dir=Path(self.tmp_dir.name))
+        self.scraper.parse = mock.Mock(return_value=GAMES)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def scrape(self, response):
+        with mock.patch('game_scraper.scrapers.generic.requests.get') as get:
+            if isinstance(response, Exception):
+                get.side_effect = response
+            else:
+                get.return_value = response
+            games = self.scraper.scrape({})
+        return games, get
+
+    def test_first_fetch_is_changed(self):
+        games, _ = self.scrape(make_response(body='v1', headers={'ETag': '"v1"'}))
+        self.assertEqual(games, GAMES)
+        self.assertEqual(self.scraper.status, 'changed')
+
+    def test_not_modified_reuses_entries(self):
+        self.scrape(make_response(body='v1', headers={'ETag': '"v1"'}))
+        self.scraper.parse.reset_mock()
+
+        games, get = self.scrape(make_response(status_code=304, body=''))
+        self.assertEqual(get.call_args.kwargs['headers']['If-None-Match'], '"v1"')
+        self.assertEqual(games, GAMES)
+        self.assertEqual(self.scraper.status, 'unchanged')
+        self.scraper.parse.assert_not_called()
+
+    def test_same_body_skips_parsing(self):
+        self.scrape(make_response(body='v1'))
+        self.scraper.parse.reset_mock()
+
+        games, _ = self.scrape(make_response(body='v1'))
+        self.assertEqual(games, GAMES)
+        self.assertEqual(self.scraper.status, 'unchanged')
+        self.scraper.parse.assert_not_called()
+
+    def test_changed_body_with_same_entries_is_unchanged(self):
+        self.scrape(make_response(body='v1 ad-slot-1'))
+        games, _ = self.scrape(make_response(body='v1 ad-slot-2'))
+        self.assertEqual(games, GAMES)
+        self.assertEqual(self.scraper.status, 'unchanged')
+        self.scraper.parse.assert_called()
+
+    def test_changed_entries_are_changed(self):
+        self.scrape(make_response(body='v1'))
+        new_games = [{'rank': 1, 'title': 'Doom', 'source': 'IGN'}]
+        self.scraper.parse.return_value = new_games
+
+        games, _ = self.scrape(make_response(body='v2'))
+        self.assertEqual(games, new_games)
+        self.assertEqual(self.scraper.status, 'changed')
+
+    def test_failure_keeps_state(self):
+        self.scrape(make_response(body='v1'))
+        state = self.scraper.state_file.read_bytes()
+
+        games, _ = self.scrape(ConnectionError("offline"))
+        self.assertEqual(games, [])
+        self.assertEqual(self.scraper.status, 'failed')
+        self.assertEqual(self.scraper.state_file.read_bytes(), state)
+
+    def test_corrupt_state_is_ignored(self):
+        self.scrape(make_response(body='v1'))
+        self.scraper.state_file.write_text('{"url": "https://exa', encoding='utf-8')
+
+        games, get = self.scrape(make_response(body='v1'))
+        self.assertNotIn('If-None-Match', get.call_args.kwargs['headers'])
+        self.assertEqual(games, GAMES)
+        self.assertEqual(self.scraper.status, 'changed')
+
+
+if __name__ == '__main__':
+    unittest.main()
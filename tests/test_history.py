@@ -0,0 +1,133 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from game_scraper.history import HistoryStore
+
+
+def make_game(title, rankings, steam_id=None, price='$19.99', user_score=0.9):
+    return {
+        'title': title,
+        'steam_id': steam_id,
+        'rankings': rankings,
+        'price': price,
+        'user_score': user_score,
+        'total_reviews': 100,
+        'platforms': {'steamdeck': 'gold'},
+        'metacritic': None
+    }
+
+
+class TestHistoryStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.history_dir = Path(self.tmp_dir.name) / 'history'
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        store = HistoryStore(self.history_dir)
+        store.append_run([make_game('Half-Life Alyx', {'IGN': 5}, steam_id=546560)], '2024-01-01')
+        store.append_run([make_game('Half-Life Alyx', {'IGN': 2}, steam_id=546560, price='$29.99')], '2024-02-01')
+
+        history = HistoryStore(self.history_dir).game_history('half-life alyx')
+        self.assertEqual(history['rank:IGN'], [('2024-01-01', 5), ('2024-02-01', 2)])
+        self.assertEqual(history['price'], [('2024-01-01', '$19.99'), ('2024-02-01', '$29.99')])
+        self.assertEqual(history['user_score'], [('2024-01-01', 0.9)])
+
+    def test_dropped_game(self):
+        store = HistoryStore(self.history_dir)
+        store.append_run([make_game('Zelda', {'IGN': 1}), make_game('Doom', {'IGN': 2})], '2024-01-01')
+        store.append_run([make_game('Doom', {'IGN': 1})], '2024-02-01')
+
+        history = HistoryStore(self.history_dir).game_history('Zelda')
+        self.assertEqual(history['rank:IGN'], [('2024-01-01', 1), ('2024-02-01', None)])
+        self.assertEqual(history['title'], [('2024-01-01', 'Zelda')])
+
+    def test_failed_source_keeps_rankings(self):
+        store = HistoryStore(self.history_dir)
+        store.append_run([make_game('Zelda', {'IGN': 1}), make_game('Doom', {'IGN': 2, 'PCGamer': 3})], '2024-01-01')
+        store.append_run([make_game('Doom', {'PCGamer': 3})], '2024-02-01', failed_sources=['IGN'])
+
+        self.assertEqual(store.game_history('Zelda')['rank:IGN'], [('2024-01-01', 1)])
+        self.assertEqual(store.game_history('Doom')['rank:IGN'], [('2024-01-01', 2)])
+
+    def test_games_sharing_a_key_are_folded(self):
+        store = HistoryStore(self.history_dir)
+        for run_date in ('2024-01-01', '2024-02-01', '2024-03-01'):
+            store.append_run([
+                make_game('The Witcher III', {'IGN': 4}, steam_id=292030),
+                make_game('Witcher III GOTY', {'PCGamer': 9}, steam_id=292030),
+            ], run_date)
+
+        history = HistoryStore(self.history_dir).game_history('292030')
+        self.assertEqual(history['title'], [('2024-01-01', 'The Witcher III')])
+        self.assertEqual(history['rank:IGN'], [('2024-01-01', 4)])
+        self.assertEqual(history['rank:PCGamer'], [('2024-01-01', 9)])
+
+    def test_late_steam_match_keeps_title_history(self):
+        store = HistoryStore(self.history_dir)
+        store.append_run([make_game('Outer Wilds', {'IGN': 5})], '2024-01-01')
+        store.append_run([make_game('Outer Wilds', {'IGN': 3}, steam_id=753640)], '2024-02-01')
+
+        store = HistoryStore(self.history_dir)
+        self.assertEqual(len(store.events), 1)
+        self.assertEqual(store.game_history('Outer Wilds')['rank:IGN'],
+                         [('2024-01-01', 5), ('2024-02-01', 3)])
+
+    def test_biggest_movers(self):
+        store = HistoryStore(self.history_dir)
+        store.append_run([make_game('Zelda', {'IGN': 10}), make_game('Doom', {'IGN': 20})], '2024-01-01')
+        store.append_run([make_game('Zelda', {'IGN': 8}), make_game('Doom', {'IGN': 20})], '2024-03-01')
+        store.append_run([make_game('Zelda', {'IGN': 1}), make_game('Doom', {'IGN': 30}, price='$5')], '2024-05-01')
+
+        # Baseline is the last run before the date
+        movers = store.biggest_movers('2024-04-01')
+        self.assertEqual([(m['title'], m['from'], m['to'], m['change']) for m in movers],
+                         [('Doom', 20, 30, -10), ('Zelda', 8, 1, 7)])
+
+        # Dates before the first run compare against the first run
+        movers = store.biggest_movers('2023-01-01')
+        self.assertEqual(movers[0]['title'], 'Doom')
+        self.assertEqual(movers[1]['change'], 9)
+
+    def test_biggest_movers_ignores_string_fields(self):
+        store = HistoryStore(self.history_dir)
+        store.append_run([make_game('Doom', {'IGN': 2})], '2024-01-01')
+        store.append_run([make_game('Doom', {'IGN': 2}, price='$5', user_score=0.5)], '2024-02-01')
+
+        movers = store.biggest_movers('2024-01-15', field_prefix='')
+        self.assertEqual([m['field'] for m in movers], ['user_score'])
+        with self.assertRaises(ValueError):
+            store.biggest_movers('2024-01-15', field_prefix='price')
+
+    def test_torn_last_line(self):
+        store = HistoryStore(self.history_dir)
+        store.append_run([make_game('Doom', {'IGN': 2})], '2024-01-01')
+        with open(self.history_dir / 'deltas.jsonl', 'a', encoding='utf-8') as f:
+            f.write('{"date":"2024-02-01","keys":[')
+
+        store = HistoryStore(self.history_dir)
+        self.assertEqual(store.runs, ['2024-01-01'])
+        store.append_run([make_game('Doom', {'IGN': 1})], '2024-03-01')
+        self.assertEqual(HistoryStore(self.history_dir).game_history('Doom')['rank:IGN'],
+                         [('2024-01-01', 2), ('2024-03-01', 1)])
+
+    def test_export_file_names_are_unique(self):
+        store = HistoryStore(self.history_dir)
+        store.append_run([make_game('Half-Life', {'IGN': 1}), make_game('Half Life', {'PCGamer': 2})], '2024-01-01')
+
+        output_dir = Path(self.tmp_dir.name) / 'export'
+        store.export_game_files(output_dir)
+        with open(output_dir / 'index.json', 'r', encoding='utf-8') as f:
+            index = json.load(f)
+
+        self.assertEqual(len(index), 2)
+        self.assertEqual(len({entry['file'] for entry in index.values()}), 2)
+        for entry in index.values():
+            self.assertTrue((output_dir / entry['file']).exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
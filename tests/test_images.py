@@ -0,0 +1,100 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from game_scraper.images import Image, ImageMirror
+
+
+def make_image(color):
+    buffer = io.BytesIO()
+    Image.new('RGB', (8, 8), color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def make_response(status_code=200, content=b'', headers=None):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class TestImageMirror(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.tmp_dir.name)
+        self.mirror = ImageMirror({}, root / 'cache', root / 'thumbs')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_mirror(self, urls, responses):
+        def get(url, headers, timeout):
+            response = responses[url]
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        games = [{'title': f'Game {i}', 'header_image': url} for i, url in enumerate(urls)]
+        with mock.patch('game_scraper.images.requests.get', side_effect=get) as patched:
+            self.mirror.mirror(games)
+        return [game['header_image'] for game in games], patched
+
+    def test_not_modified_keeps_thumbnail(self):
+        url = 'https://example.com/a.jpg'
+        first, _ = self.run_mirror([url], {url: make_response(content=make_image('red'), headers={'ETag': '"a"'})})
+
+        second, get = self.run_mirror([url], {url: make_response(status_code=304)})
+        self.assertEqual(get.call_args.kwargs['headers']['If-None-Match'], '"a"')
+        self.assertEqual(second, first)
+        self.assertTrue((self.mirror.output_dir / Path(first[0]).name).exists())
+
+    def test_same_bytes_share_thumbnail(self):
+        content = make_image('blue')
+        urls = ['https://example.com/a.jpg', 'https://example.com/b.jpg']
+        images, _ = self.run_mirror(urls, {url: make_response(content=content) for url in urls})
+
+        self.assertEqual(images[0], images[1])
+        self.assertTrue(images[0].startswith('images/thumbs/'))
+        self.assertEqual(len(list(self.mirror.output_dir.iterdir())), 1)
+
+    def test_failed_download_keeps_url(self):
+        good, bad = 'https://example.com/a.jpg', 'https://example.com/b.jpg'
+        images, _ = self.run_mirror([good, bad], {
+            good: make_response(content=make_image('green')),
+            bad: ConnectionError("offline"),
+        })
+
+        self.assertTrue(images[0].startswith('images/thumbs/'))
+        self.assertEqual(images[1], bad)
+
+    def test_remove_unused(self):
+        old, new = 'https://example.com/old.jpg', 'https://example.com/new.jpg'
+        self.run_mirror([old], {old: make_response(content=make_image('red'))})
+        images, _ = self.run_mirror([new], {new: make_response(content=make_image('blue'))})
+
+        index = self.mirror._load_index()
+        self.assertEqual(list(index), [new])
+        self.assertEqual([f"images/thumbs/{f.name}" for f in self.mirror.output_dir.iterdir()], images)
+        originals = {f.name for f in self.mirror.cache_dir.iterdir()} - {'index.json'}
+        self.assertEqual(originals, {index[new]['sha256']})
+
+    def test_remove_unused_keeps_thumbnails_in_use(self):
+        self.mirror.cache_dir.mkdir(parents=True)
+        self.mirror.output_dir.mkdir(parents=True)
+        for name in ('a.webp', 'b.webp'):
+            (self.mirror.output_dir / name).write_bytes(b'')
+        index = {
+            'https://example.com/a.jpg': {'sha256': 'a' * 64, 'thumbnail': 'images/thumbs/a.webp'},
+            'https://example.com/b.jpg': {'sha256': 'b' * 64, 'thumbnail': 'images/thumbs/b.webp'},
+        }
+
+        self.mirror._remove_unused(index, {'images/thumbs/a.webp'})
+        self.assertEqual(list(index), ['https://example.com/a.jpg'])
+        self.assertEqual([f.name for f in self.mirror.output_dir.iterdir()], ['a.webp'])
+
+
+if __name__ == '__main__':
+    unittest.main()